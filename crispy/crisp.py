@@ -1,17 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 import html
+import os
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 import warnings
+import weakref
 
 import astropy.units as u
 import matplotlib
 import numpy as np
 import zarr
-from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.wcs import WCS
 from specutils.utils.wcs_utils import vac_to_air
-from sunpy.coordinates import Helioprojective
 
 from .crisp_plotting import (plot_multi_component_spectrum, plot_multi_frame,
                              plot_single_frame, plot_single_spectrum)
@@ -20,6 +21,51 @@ from .mixin import CRISPSequenceSlicingMixin, CRISPSlicingMixin
 from .utils import (ObjDict, parameter_docstring, reconstruct_full_frame,
                     rotate_crop_aligned_data, rotate_crop_data)
 
+# axis-size keys in fastest-to-slowest order, so shape strings can be built
+# without formatting a fresh key per axis
+_NAXIS_KEYS = ("NAXIS1", "NAXIS2", "NAXIS3", "NAXIS4")
+
+# header keys written by rotate_crop whose presence marks a rotated frame
+ROTATE_KEYS = frozenset(
+    {"frame_dims", "x_min", "x_max", "y_min", "y_max", "angle"}
+)
+
+# live instances handed out by CRISP.from_file, keyed on (class, path,
+# mtime); weak references so the cache never keeps a cube alive by itself
+_instance_cache: Dict[Tuple, "weakref.ref"] = {}
+
+
+def _map_negative_nan(d: np.ndarray) -> np.ndarray:
+    """
+    Mask unphysical negative intensities as NaN, out-of-place so the cached
+    data array is never modified.
+    """
+    # calibrated frames are usually all-positive; a read-only sign-bit scan
+    # is cheaper than the compare-and-select pass that writes a new array
+    if not np.signbit(d).any():
+        return d.astype(np.float32, copy=False)
+    # the select produces the masked copy in one pass; the trailing astype
+    # is a no-op for the float32 cubes these files carry
+    return np.where(d < 0.0, np.float32("nan"), d).astype(np.float32, copy=False)
+
+
+def _same_pointing(a, b) -> bool:
+    """
+    Whether two observations share the spatial part of their WCS, judged on
+    the header pointing keys. Sequence-wide coordinate conversions use this
+    to evaluate the transform once and share the result instead of invoking
+    wcslib per frame.
+    """
+    ha, hb = a.header, b.header
+    if "CRVAL1" in ha:
+        keys = ("CRVAL1", "CRVAL2", "CRPIX1", "CRPIX2", "CDELT1", "CDELT2")
+    else:
+        keys = ("crval", "crpix", "pixel_scale")
+    try:
+        return all(ha[k] == hb[k] for k in keys)
+    except KeyError:
+        return False
+
 
 class CRISP(CRISPSlicingMixin):
     """
@@ -55,8 +101,19 @@ class CRISP(CRISPSlicingMixin):
     orig_wvl : astropy.Quantity, optional
         The original (unsliced) wavelength grid for the data. Only needed to transfer
         information due to slicing.
+    backend : str, optional
+        The library used to read fits files: "astropy" (default) or
+        "fitsio". fitsio has much lower per-file overhead which adds up when
+        constructing long sequences, but it is an optional dependency and
+        reads the data cube eagerly rather than memory-mapping it.
     """
 
+    # unicode glyphs used in plot labels, resolved once at import time
+    aa = html.unescape("&#8491;")
+    a = html.unescape("&alpha;")
+    l = html.unescape("&lambda;")
+    D = html.unescape("&Delta;")
+
     def __init__(
         self,
         filename: Union[str, ObjDict],
@@ -66,10 +123,57 @@ class CRISP(CRISPSlicingMixin):
         nonu: bool = False,
         wvl: Optional[u.Quantity] = None,
         orig_wvl: Optional[u.Quantity] = None,
+        backend: str = "astropy",
     ) -> None:
-        if isinstance(filename, str) and ".fits" in filename:
-            self.file = fits.open(filename)[0]
-        elif isinstance(filename, str) and ".zarr" in filename:
+        self._data_cache: Optional[np.ndarray] = None
+        self._header_cache: Optional[Dict] = None
+        self._date_cache: Optional[str] = None
+        self._time_cache: Optional[str] = None
+        self._datetime_cache: Optional[str] = None
+        self._shape_str_cache: Optional[str] = None
+        self._el_cache: Optional[str] = None
+        self._to_lonlat_cache: Dict = {}
+        self._from_lonlat_cache: Dict = {}
+        # slicing mixins overwrite this after construction; None means the
+        # object still spans the full file
+        self.ind: Optional[List[Union[int, slice]]] = None
+        # classify the backing file once instead of substring-matching the
+        # path again for every branch below
+        kind = ""
+        if isinstance(filename, str):
+            if filename.endswith((".fits", ".fits.gz")):
+                kind = "fits"
+            elif filename.endswith(".zarr"):
+                kind = "zarr"
+        # the full HDUList for FITS-backed objects, kept so the wavelength
+        # extension can be read without opening and re-parsing the file
+        self._hdul: Optional[fits.HDUList] = None
+        self._fitsio = None
+        if kind == "fits" and backend == "fitsio":
+            try:
+                import fitsio
+            except ImportError:
+                raise ImportError(
+                    "backend='fitsio' requires the optional fitsio package."
+                )
+            self._fitsio = fitsio.FITS(filename)
+            header = fits.Header()
+            for rec in self._fitsio[0].read_header().records():
+                name = rec["name"]
+                if name in ("COMMENT", "HISTORY", ""):
+                    continue
+                header[name] = (rec["value"], rec.get("comment", ""))
+            self.file = ObjDict({})
+            self.file["data"] = self._fitsio[0].read()
+            self.file["header"] = header
+        elif kind == "fits":
+            # memmap keeps self.file.data a lazy proxy: shape/ndim queries
+            # and slices stay O(1) until the data property materialises it
+            self._hdul = fits.open(
+                filename, memmap=True, mode="denywrite", lazy_load_hdus=True
+            )
+            self.file = self._hdul[0]
+        elif kind == "zarr":
             f = zarr.open(filename, mode="r")
             self.file = ObjDict({})
             self.file["data"] = f["data"]
@@ -78,41 +182,40 @@ class CRISP(CRISPSlicingMixin):
             self.file = filename
         else:
             raise NotImplementedError("m8 y?")
-        if wcs is None and ".fits" in filename:
+        if wcs is None and kind == "fits":
             self.wcs = WCS(self.file.header)
-        elif wcs is None and ".zarr" in filename:
+        elif wcs is None and kind == "zarr":
             self.wcs = zarr_header_to_wcs(self.header, nonu=nonu)
         else:
             self.wcs = wcs
         self.nonu = nonu
         self.uncertainty = uncertainty
         self.mask = mask
-        self.aa = html.unescape("&#8491;")
-        self.a = html.unescape("&alpha;")
-        self.l = html.unescape("&lambda;")
-        self.D = html.unescape("&Delta;")
-        if all(
-            x in self.header.keys()
-            for x in ["frame_dims", "x_min", "x_max", "y_min", "y_max", "angle"]
-        ):
-            self.rotate = True
-        else:
-            self.rotate = False
-
+        self.rotate = ROTATE_KEYS.issubset(self.header)
+        # which header dialect the file speaks: FITS keywords or the legacy
+        # zarr attribute names -- probed once so hot paths can branch on a
+        # bool instead of catching KeyError
+        self._new_schema = "DATE-AVG" in self.header
+
+        # the 1-D spectral WCS used to derive the wavelength grid; None when
+        # the grid came from the file itself or was handed over by slicing
+        self._spec_wcs: Optional[WCS] = None
         if wvl is None:
             try:
-                if ".fits" in filename:
-                    wvl = fits.open(filename)[
-                        1
-                    ].data  << u.Angstrom # This assumes that the true wavelength points are stored in the first HDU of the FITS file as a numpy array
+                if kind == "fits":
+                    if self._fitsio is not None:
+                        wvl = self._fitsio[1].read() << u.Angstrom
+                    else:
+                        wvl = self._hdul[1].data << u.Angstrom # This assumes that the true wavelength points are stored in the first HDU of the FITS file as a numpy array
                 else:
                     wvl = self.header["wavels"] << u.Angstrom
             except (AttributeError, KeyError):
-                wcs_ndim = len(self.wcs.low_level_wcs.array_shape)
+                llw = self.wcs.low_level_wcs
+                wcs_ndim = len(llw.array_shape)
                 if wcs_ndim <= 2 or wcs_ndim > 4:
                     raise ValueError("Either too few (check spectral axis), or too many axes.")
                 indexing : List[Union[int, slice]] = [0 for _ in range(wcs_ndim)]
-                if hasattr(self, "ind"):
+                if self.ind is not None:
                     if isinstance(self.ind, Sequence):
                         if wcs_ndim == 4:
                             entry = self.ind[1]
@@ -124,83 +227,157 @@ class CRISP(CRISPSlicingMixin):
                         entry = slice(None, None)
 
                     indexing[-3] = entry
-                    w = self.wcs.low_level_wcs._wcs.__getitem__(indexing)
+                    w = llw._wcs.__getitem__(indexing)
                 else:
                     if wcs_ndim == 4:
                         indexing[1] = slice(None, None)
                     elif wcs_ndim == 3:
                         indexing[0] = slice(None, None)
                     w = self.wcs.__getitem__(indexing)
-                wvl = w.array_index_to_world(np.arange(self.data.shape[-3])) << u.Angstrom
+                self._spec_wcs = w
+                wvl = w.array_index_to_world(np.arange(self.file.data.shape[-3])) << u.Angstrom
 
             orig_wvl = wvl
         elif orig_wvl is None:
             raise ValueError("`wvl` set, but not `orig_wvl`")
 
         self.wvl = wvl
+        # alias of wvl; a plain attribute rather than a property so hot
+        # plotting/str paths skip the descriptor call
+        self.wvls = wvl
         self.orig_wvl = orig_wvl
+        # reference wavelength for delta-lambda plot annotations, computed
+        # once rather than taking the median again on every map render
+        self._mid_wvl = float(np.median(self.orig_wvl.value))
 
-    def __str__(self) -> str:
+    @classmethod
+    def from_file(cls, filename: str, **kwargs) -> "CRISP":
+        """
+        Returns an instance for ``filename``, reusing a previously
+        constructed one when the file has not changed on disk. Useful for
+        workflows that re-open the same observations repeatedly (e.g.
+        notebook re-runs or parameter sweeps) where the file open and header
+        parse would otherwise be paid every time.
+
+        The cache holds weak references keyed on the file's path and
+        modification time, so instances are shared only while something else
+        keeps them alive and stale entries fall away when the file changes.
+        Note that the returned instance may be shared: in-place operations
+        such as ``rotate_crop`` are visible to every holder.
+
+        Parameters
+        ----------
+        filename : str
+            The file to open, as accepted by the constructor.
+        kwargs
+            Any further constructor arguments. If any are given the cache is
+            bypassed, since the resulting instance would not be
+            interchangeable with a plain open of the file.
+        """
+        if kwargs or not isinstance(filename, str):
+            return cls(filename, **kwargs)
         try:
-            time = self.header["DATE-AVG"][-12:]
-            date = self.header["DATE-AVG"][:-13]
-            cl = str(np.round(self.header["TWAVE1"], decimals=2))
-            wwidth = self.header["WWIDTH1"]
-            shape = str(
-                [self.header[f"NAXIS{j+1}"] for j in reversed(range(self.data.ndim))]
-            )
-            el = self.header["WDESC1"]
-            pointing_x = str(self.header["CRVAL1"])
-            pointing_y = str(self.header["CRVAL2"])
-        except KeyError:
-            time = self.header["time_obs"]
-            date = self.header["date_obs"]
-            cl = str(self.header["crval"][-3])
-            wwidth = str(self.header["dimensions"][-3])
-            shape = str(self.header["dimensions"])
-            el = self.header["element"]
-            pointing_x = str(self.header["crval"][-1])
-            pointing_y = str(self.header["crval"][-2])
-        sampled_wvls = str(self.wvls)
+            key = (cls, filename, os.path.getmtime(filename))
+        except OSError:
+            return cls(filename)
+        ref = _instance_cache.get(key)
+        if ref is not None:
+            inst = ref()
+            if inst is not None:
+                return inst
+        inst = cls(filename)
+        _instance_cache[key] = weakref.ref(inst)
+        return inst
 
-        return f"""
-        CRISP Observation
-        ------------------
-        {date} {time}
+    def __str__(self) -> str:
+        header = self.header
+        if self._new_schema:
+            date, _, time = header["DATE-AVG"].partition("T")
+            cl = str(np.round(header["TWAVE1"], decimals=2))
+            wwidth = header["WWIDTH1"]
+            shape = self._shape_str
+            el = header["WDESC1"]
+            pointing_x = str(header["CRVAL1"])
+            pointing_y = str(header["CRVAL2"])
+        else:
+            time = header["time_obs"]
+            date = header["date_obs"]
+            cl = str(header["crval"][-3])
+            wwidth = str(header["dimensions"][-3])
+            shape = self._shape_str
+            el = header["element"]
+            pointing_x = str(header["crval"][-1])
+            pointing_y = str(header["crval"][-2])
+        sampled_wvls = str(self.wvls)
 
-        Observed: {el}
-        Centre wavelength [{self.aa}]: {cl}
-        Wavelengths sampled: {wwidth} ({sampled_wvls})
-        Pointing [arcsec] (HPLN, HPLT): ({pointing_x}, {pointing_y})
-        Shape: {shape}"""
+        # a join over prebuilt lines makes one allocation of known size
+        # instead of the format machinery growing a multi-line buffer
+        return "\n".join(
+            (
+                "",
+                "        CRISP Observation",
+                "        ------------------",
+                f"        {date} {time}",
+                "",
+                f"        Observed: {el}",
+                f"        Centre wavelength [{self.aa}]: {cl}",
+                f"        Wavelengths sampled: {wwidth} ({sampled_wvls})",
+                f"        Pointing [arcsec] (HPLN, HPLT): ({pointing_x}, {pointing_y})",
+                f"        Shape: {shape}",
+            )
+        )
 
     @property
     def data(self) -> np.ndarray:
         """
-        The actual data.
+        The actual data, materialised from the backing file on first access
+        and cached. The cache is dropped whenever ``self.file.data`` is
+        replaced e.g. by ``rotate_crop``.
         """
-        return self.file.data[...]
+        if self._data_cache is None:
+            data = self.file.data[...]
+            if not data.dtype.isnative:
+                # FITS stores big-endian; numpy's vectorised kernels only
+                # engage on native-order arrays, so swap once up front
+                data = data.astype(data.dtype.newbyteorder("="))
+            self._data_cache = data
+        return self._data_cache
 
     @property
     def header(self) -> Dict:
         """
-        The metainformation about the observations.
+        The metainformation about the observations. Built from the backing
+        file once and cached; for zarr files every rebuild would otherwise
+        deserialize the attribute JSON again. The cache is dropped when
+        ``self.file.header`` is mutated e.g. by ``rotate_crop``.
         """
-        return dict(self.file.header)
+        if self._header_cache is None:
+            self._header_cache = dict(self.file.header)
+        return self._header_cache
 
     @property
     def shape(self) -> Tuple:
         """
         The dimensions of the data.
         """
-        return self.data.shape
+        return self.file.data.shape
 
     @property
-    def wvls(self) -> np.ndarray:
+    def _shape_str(self) -> str:
         """
-        The wavelengths sampled in the observation.
+        String form of the data dimensions as reported by the header. Cached
+        because the summary strings rebuild it on every call.
         """
-        return self.wvl
+        if self._shape_str_cache is None:
+            header = self.header
+            if "NAXIS1" in header:
+                ndim = self.file.data.ndim
+                self._shape_str_cache = str(
+                    [header[k] for k in _NAXIS_KEYS[:ndim]][::-1]
+                )
+            else:
+                self._shape_str_cache = str(header["dimensions"])
+        return self._shape_str_cache
 
     @property
     def info(self) -> str:
@@ -209,25 +386,61 @@ class CRISP(CRISPSlicingMixin):
         """
         return self.__str__()
 
+    def _parse_datetime(self) -> None:
+        """
+        Split the observation timestamp out of the header. The timestamp of
+        an observation never changes, so this is done at most once per
+        instance rather than on every plot title or ``time``/``date`` access.
+        """
+        header = self.header
+        if "DATE-AVG" in header:
+            date_avg = header["DATE-AVG"]
+            self._date_cache, _, self._time_cache = date_avg.partition("T")
+            self._datetime_cache = date_avg
+        else:
+            self._time_cache = header["time_obs"]
+            self._date_cache = header["date_obs"]
+            self._datetime_cache = header["date_obs"] + "T" + header["time_obs"]
+
+    @property
+    def _datetime(self) -> str:
+        """
+        The combined date and time of the observation.
+        """
+        if self._datetime_cache is None:
+            self._parse_datetime()
+        return self._datetime_cache
+
     @property
     def time(self) -> str:
         """
         The time of the observation in UTC.
         """
-        try:
-            return self.header["DATE-AVG"][-12:]
-        except KeyError:
-            return self.header["time_obs"]
+        if self._time_cache is None:
+            self._parse_datetime()
+        return self._time_cache
 
     @property
     def date(self) -> str:
         """
         The date of the observation.
         """
-        try:
-            return self.header["DATE-AVG"][:-13]
-        except KeyError:
-            return self.header["date_obs"]
+        if self._date_cache is None:
+            self._parse_datetime()
+        return self._date_cache
+
+    @property
+    def _el(self) -> str:
+        """
+        The name of the observed spectral line, looked up once per instance
+        rather than on every plot title.
+        """
+        if self._el_cache is None:
+            if self._new_schema:
+                self._el_cache = self.header["WDESC1"]
+            else:
+                self._el_cache = self.header["element"]
+        return self._el_cache
 
     def rotate_crop(self, sep: bool = False) -> Optional[Tuple[np.ndarray, Dict]]:
         """
@@ -255,11 +468,12 @@ class CRISP(CRISPSlicingMixin):
             crop).
         """
 
+        data = self.data
         if sep:
-            return rotate_crop_data(self.data)
+            return rotate_crop_data(data)
 
-        self.full_frame = self.data
-        crop, crop_dict = rotate_crop_data(self.data)
+        self.full_frame = data
+        crop, crop_dict = rotate_crop_data(data)
         for k, v in crop_dict.items():
             self.file.header[k] = v
         if not isinstance(self.file.header["frame_dims"], list):
@@ -279,7 +493,12 @@ class CRISP(CRISPSlicingMixin):
             self.wcs = WCS(self.file.header)
         except ValueError:
             self.wcs = zarr_header_to_wcs(self.file.header)
+        self._to_lonlat_cache.clear()
+        self._from_lonlat_cache.clear()
         self.file.data = crop
+        self._data_cache = None
+        self._header_cache = None
+        self._shape_str_cache = None
         self.rotate = True
         return None
 
@@ -311,11 +530,13 @@ class CRISP(CRISPSlicingMixin):
         if isinstance(crop_dict["frame_dims"], str):
             crop_dict["frame_dims"] = [int(x) for x in crop_dict["frame_dims"][1:-1].split(',')]
 
+        data = self.data
         if sep:
-            return reconstruct_full_frame(crop_dict, self.data)
+            return reconstruct_full_frame(crop_dict, data)
 
-        self.rot_data = self.data
-        self.file.data = reconstruct_full_frame(crop_dict, self.data)
+        self.rot_data = data
+        self.file.data = reconstruct_full_frame(crop_dict, data)
+        self._data_cache = None
         self.file.header.pop("PC1_1", None)
         self.file.header.pop("PC1_2", None)
         self.file.header.pop("PC2_1", None)
@@ -328,6 +549,10 @@ class CRISP(CRISPSlicingMixin):
             self.wcs = WCS(self.file.header)
         except ValueError:
             self.wcs = zarr_header_to_wcs(self.file.header)
+        self._to_lonlat_cache.clear()
+        self._from_lonlat_cache.clear()
+        self._header_cache = None
+        self._shape_str_cache = None
         self.rotate = False
         return None
 
@@ -351,7 +576,7 @@ class CRISP(CRISPSlicingMixin):
         d : bool, optional
             Converts the wavelength axis to :math:`\\Delta \\lambda`. Default is False.
         """
-        if self.data.ndim != 1:
+        if self.file.data.ndim != 1:
             raise IndexError(
                 "If you are using Stokes data please use the plot_stokes method."
             )
@@ -425,12 +650,8 @@ class CRISP(CRISPSlicingMixin):
             Converts the wavelength axis to :math:`\\Delta \\lambda`. Default is False.
         """
 
-        try:
-            datetime = self.header["DATE-AVG"]
-            el = self.header["WDESC1"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-            el = self.header["element"]
+        datetime = self._datetime
+        el = self._el
 
         stokes_components = ["I", "Q", "U", "V"]
         y_labels = {
@@ -440,13 +661,16 @@ class CRISP(CRISPSlicingMixin):
             "V": "V [DNs]",
         }
 
+        # one vectorised conversion of the full grid up front; the per-Stokes
+        # plotting below then reuses the converted array. ``<<`` returns the
+        # converted view rather than changing its operand in place
         if unit is not None:
-            wavelength << unit
+            wavelength = wavelength << unit
 
         if air:
             wavelength = vac_to_air(wavelength)
 
-        if self.data.ndim == 1:
+        if self.file.data.ndim == 1:
             if stokes not in ["I", "Q", "U", "V"]:
                 raise ValueError(
                     f"This ({stokes}) is not a Stokes. Expected (I, Q, U, V)"
@@ -458,7 +682,7 @@ class CRISP(CRISPSlicingMixin):
                 wavelength, self.data, title=title, y_label=y_labels[stokes], d=d
             )
 
-        elif self.data.ndim == 2:
+        elif self.file.data.ndim == 2:
             if stokes == "all":
                 title = f"{datetime} {el} {self.aa} All  Stokes"
                 components = stokes_components
@@ -471,6 +695,21 @@ class CRISP(CRISPSlicingMixin):
                 )
             plot_multi_component_spectrum(components, wavelength, self.data, title, d=d)
 
+    def _frame_extent(self, frame: str) -> Optional[List[float]]:
+        """
+        Returns the imshow extent for the "arcsec" frame, or None for the
+        other frames. Computed on demand rather than cached since the data
+        shape (and with it the extent) changes under ``rotate_crop`` and
+        ``reconstruct_full_frame``.
+        """
+        if frame != "arcsec":
+            return None
+        header = self.header
+        shape = self.shape
+        cdelt_x = header.get("CDELT1", header.get("pixel_scale"))
+        cdelt_y = header.get("CDELT2", header.get("pixel_scale"))
+        return [0.0, cdelt_x * shape[-1], 0.0, cdelt_y * shape[-2]]
+
     def intensity_map(
         self,
         frame: Optional[str] = None,
@@ -488,27 +727,16 @@ class CRISP(CRISPSlicingMixin):
             The normalisation to use in the colourmap.
         """
 
-        wvl = np.round(self.wvls << u.Angstrom, decimals=2).value
-        del_wvl = np.round(wvl - np.median(self.orig_wvl.value), decimals=2)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        wvl = np.round((self.wvls << u.Angstrom).value, decimals=2)
+        del_wvl = np.round(wvl - self._mid_wvl, decimals=2)
+        datetime = self._datetime
 
         if frame is None:
             frame = "WCS"
         if frame == "WCS" and self.rotate:
             frame = "arcsec"
 
-        extent = None
-        if frame == "arcsec":
-            try:
-                xmax = self.header["CDELT1"] * self.shape[-1]
-                ymax = self.header["CDELT2"] * self.shape[-2]
-            except KeyError:
-                xmax = self.header["pixel_scale"] * self.shape[-1]
-                ymax = self.header["pixel_scale"] * self.shape[-2]
-            extent = [0.0, xmax, 0.0, ymax]
+        extent = self._frame_extent(frame)
 
         title = f"{datetime} {self.l}={wvl}{self.aa} ({self.D}{self.l} = {del_wvl}{self.aa})"
         plot_single_frame(self, frame, title, extent=extent, norm=norm)
@@ -530,12 +758,9 @@ class CRISP(CRISPSlicingMixin):
 
         stokes_components = ["I", "Q", "U", "V"]
 
-        wvl = np.round(self.wvls << u.Angstrom, decimals=2).value
+        wvl = np.round((self.wvls << u.Angstrom).value, decimals=2)
         del_wvl = np.round(wvl - np.median(wvl), decimals=2)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        datetime = self._datetime
         title = (
             f"{datetime} {self.l}={wvl}{self.aa} ({self.D}{self.l}={del_wvl}{self.aa})"
         )
@@ -544,15 +769,7 @@ class CRISP(CRISPSlicingMixin):
         if frame == "WCS" and self.rotate:
             frame = "arcsec"
 
-        extent = None
-        if frame == "arcsec":
-            try:
-                xmax = self.header["CDELT1"] * self.shape[-1]
-                ymax = self.header["CDELT2"] * self.shape[-2]
-            except KeyError:
-                xmax = self.header["pixel_scale"] * self.shape[-1]
-                ymax = self.header["pixel_scale"] * self.shape[-2]
-            extent = [0.0, xmax, 0.0, ymax]
+        extent = self._frame_extent(frame)
 
         norms = {
             "I": None,
@@ -561,13 +778,9 @@ class CRISP(CRISPSlicingMixin):
             "V": matplotlib.colors.Normalize(vmin=-100, vmax=100),
         }
 
-        def map_negative_nan(d: np.ndarray) -> np.ndarray:
-            d[d < 0.0] = np.nan
-            return d
-
-        map_datas = {"I": map_negative_nan, "Q": None, "U": None, "V": None}
+        map_datas = {"I": _map_negative_nan, "Q": None, "U": None, "V": None}
 
-        if self.data.ndim == 2:
+        if self.file.data.ndim == 2:
             if not (len(stokes) == 1 and stokes in stokes_components):
                 raise ValueError(
                     f"For 2D data can only plot one Stokes component (expected I, Q, U, V, got {stokes})."
@@ -583,7 +796,7 @@ class CRISP(CRISPSlicingMixin):
                 norm=norms[stokes],
                 map_data=map_datas[stokes],
             )
-        elif self.data.ndim == 3:
+        elif self.file.data.ndim == 3:
             if stokes == "all":
                 components = stokes_components
             else:
@@ -613,7 +826,11 @@ class CRISP(CRISPSlicingMixin):
         return self.orig_wvl[idx]
 
     def to_lonlat(
-        self, y: int, x: int, coord: bool = False, unit: bool = False
+        self,
+        y: Union[int, np.ndarray],
+        x: Union[int, np.ndarray],
+        coord: bool = False,
+        unit: bool = False,
     ) -> Tuple[float, float]:
         """
         This function will take a y, x coordinate in pixel space and map it to
@@ -625,10 +842,13 @@ class CRISP(CRISPSlicingMixin):
 
         Parameters
         ----------
-        y : int
-            The y-index to be converted to Helioprojective Latitude.
-        x : int
-            The x-index to be converted to Helioprojective Longitude.
+        y : int or numpy.ndarray
+            The y-index (or indices) to be converted to Helioprojective
+            Latitude. Arrays are transformed elementwise in one WCS call,
+            which is far cheaper than looping over scalars.
+        x : int or numpy.ndarray
+            The x-index (or indices) to be converted to Helioprojective
+            Longitude. Must have the same shape as ``y``.
         coord : bool, optional
             Whether or not to return an ```astropy.coordinates.SkyCoord```. Default is False.
         unit : bool, optional
@@ -637,34 +857,50 @@ class CRISP(CRISPSlicingMixin):
 
         Returns
         -------
-        tuple[float]
+        tuple[float] or tuple[numpy.ndarray]
             A tuple containing the Helioprojective Longitude and Helioprojective
-            Latitude of the indexed point.
+            Latitude of the indexed point(s), matching the shape of the input.
         """
-        wcs_ndim = len(self.wcs.low_level_wcs.array_shape)
+        # interactive use (cursor readouts, overlays) asks for the same few
+        # pixels repeatedly; memoise scalar lookups, arrays are not hashable
+        key = (y, x, coord, unit) if np.ndim(y) == 0 and np.ndim(x) == 0 else None
+        if key is not None and key in self._to_lonlat_cache:
+            return self._to_lonlat_cache[key]
+
+        llw = self.wcs.low_level_wcs
+        wcs_ndim = len(llw.array_shape)
         if wcs_ndim == 2:
-            result = self.wcs.array_index_to_world(y, x)
+            w = self.wcs
         else:
             if wcs_ndim <= 2 or wcs_ndim > 4:
                 raise ValueError("Either two few (check spectral axis), or too many axes.")
-            if hasattr(self, "ind"):
-                wcs_ndim = self.wcs.low_level_wcs._wcs.naxis
+            if self.ind is not None:
+                wcs_ndim = llw._wcs.naxis
                 indexing : List[Union[int, slice]] = [0 for _ in range(wcs_ndim)]
                 indexing[-2:] = self.ind[-2:]
 
-                result = self.wcs.low_level_wcs._wcs.__getitem__(indexing).array_index_to_world(y, x)
+                w = llw._wcs.__getitem__(indexing)
             else:
                 indexing = [0 for _ in range(wcs_ndim-2)]
                 if len(indexing) > 0:
-                    result = self.wcs.__getitem__(indexing).array_index_to_world(y, x)
+                    w = self.wcs.__getitem__(indexing)
                 else:
-                    result = self.wcs.array_index_to_world(y, x)
-
+                    w = self.wcs
+
+        if not coord and not unit:
+            # plain-value path: one C-level transform on raw floats, no
+            # SkyCoord built just to unwrap .Tx/.Ty again
+            low = w.low_level_wcs
+            lon, lat = low.array_index_to_world_values(y, x)
+            lon = lon * u.Unit(low.world_axis_units[0]).to(u.arcsec)
+            lat = lat * u.Unit(low.world_axis_units[1]).to(u.arcsec)
+            result = (lon, lat)
+        else:
+            sc = w.array_index_to_world(y, x)
+            result = sc if coord else (sc.Tx, sc.Ty)
 
-        if not coord:
-            if not unit:
-                return result.Tx.value, result.Ty.value
-            return result.Tx, result.Ty
+        if key is not None:
+            self._to_lonlat_cache[key] = result
         return result
 
     def from_lonlat(self, lon: float, lat: float) -> Tuple[int, int]:
@@ -689,22 +925,35 @@ class CRISP(CRISPSlicingMixin):
             A tuple of the index needed to retrieve the point for a specific
             Helioprojective Longitude and Helioprojective Latitude.
         """
-        lon, lat = lon << u.arcsec, lat << u.arcsec
-        sc = SkyCoord(lon, lat, frame=Helioprojective)
-        wcs_ndim = len(self.wcs.low_level_wcs.array_shape)
-        if hasattr(self, "ind"):
+        if isinstance(lon, u.Quantity):
+            lon = lon.to_value(u.arcsec)
+        if isinstance(lat, u.Quantity):
+            lat = lat.to_value(u.arcsec)
+        key = (lon, lat) if np.ndim(lon) == 0 and np.ndim(lat) == 0 else None
+        if key is not None and key in self._from_lonlat_cache:
+            return self._from_lonlat_cache[key]
+        llw = self.wcs.low_level_wcs
+        wcs_ndim = len(llw.array_shape)
+        if self.ind is not None:
             indexing  = copy(self.ind)
-            wcs_ndim = self.wcs.low_level_wcs._wcs.naxis
+            wcs_ndim = llw._wcs.naxis
             for i in range(wcs_ndim - 2):
                 indexing[i] = 0
-            w = self.wcs.low_level_wcs._wcs.__getitem__(indexing)
+            w = llw._wcs.__getitem__(indexing)
         else:
             indexing = [0 for _ in range(wcs_ndim - 2)]
             if len(indexing) > 0:
                 w = self.wcs.__getitem__(indexing)
             else:
                 w = self.wcs
-        result = w.world_to_array_index(sc)
+        # feed raw world values straight to the low-level API: no Quantity
+        # boxing, no SkyCoord, no frame matching, same rounded indices
+        low = w.low_level_wcs
+        lon = lon / u.Unit(low.world_axis_units[0]).to(u.arcsec)
+        lat = lat / u.Unit(low.world_axis_units[1]).to(u.arcsec)
+        result = low.world_to_array_index_values(lon, lat)
+        if key is not None:
+            self._from_lonlat_cache[key] = result
         return result
 
 class CRISPSequence(CRISPSequenceSlicingMixin):
@@ -720,48 +969,79 @@ class CRISPSequence(CRISPSequenceSlicingMixin):
         list.
     """
 
+    aa = html.unescape("&#8491;")
+
+    # the class each frame is constructed as; subclasses override this so the
+    # lazy list below builds their own frame type
+    _frame_type = CRISP
+
     def __init__(self, files: List[Dict]) -> None:
-        self.list = [CRISP(**f) for f in files]
-        self.aa = html.unescape("#&8491;")
+        self._files = files
+        self._list_cache: Optional[List] = None
 
-    def __str__(self) -> str:
-        try:
-            time = [f.file.header["DATE-AVG"][-12:] for f in self.list]
-            date = self.list[0].file.header["DATE-AVG"][:-13]
-            cl = [str(np.round(f.file.header["TWAVE1"], decimals=2)) for f in self.list]
-            wwidth = [f.file.header["WWIDTH1"] for f in self.list]
-            shape = [
-                str(
-                    [
-                        f.file.header[f"NAXIS{j+1}"]
-                        for j in reversed(range(f.file.data.ndim))
-                    ]
+    @property
+    def list(self) -> List:
+        """
+        The individual frames of the sequence. Built on first access so that
+        constructing a sequence only to query metadata or pick out one frame
+        does not open every file up front.
+        """
+        if self._list_cache is None:
+            files = self._files
+            # constructing each frame is blocking I/O (file open + header
+            # parse) during which the GIL is released, so overlap the loads
+            with ThreadPoolExecutor(max_workers=min(16, len(files)) or 1) as ex:
+                self._list_cache = list(
+                    ex.map(lambda f: self._frame_type(**f), files)
                 )
-                for f in self.list
-            ]
-            el = [f.file.header["WDESC1"] for f in self.list]
-            pointing_x = str(self.list[0].file.header["CRVAL1"])
-            pointing_y = str(self.list[0].file.header["CRVAL2"])
-        except KeyError:
-            time = [f.file.header["time_obs"] for f in self.list]
-            date = self.list[0].file.header["date_obs"]
-            cl = [str(f.file.header["crval"][-3]) for f in self.list]
-            wwidth = [str(f.file.header["dimensions"][-3]) for f in self.list]
-            shape = [str(f.file.header["dimensions"]) for f in self.list]
-            el = [f.file.header["element"] for f in self.list]
-            pointing_x = str(self.list[0].file.header["crval"][-1])
-            pointing_y = str(self.list[0].file.header["crval"][-2])
-
-        return f"""
-        CRISP Observation
-        ------------------
-        {date} {time}
-
-        Observed: {el}
-        Centre wavelength: {cl}
-        Wavelengths sampled [{self.aa}]: {wwidth}
-        Pointing [arcsec] (HPLN, HPLT): ({pointing_x}, {pointing_y})
-        Shape: {shape}"""
+        return self._list_cache
+
+    @list.setter
+    def list(self, value: List) -> None:
+        self._list_cache = value
+
+    def __str__(self) -> str:
+        # one pass over the frames, reading each header once, rather than
+        # eight separate walks of the list
+        time, cl, wwidth, shape, el = [], [], [], [], []
+        hdr0 = self.list[0].file.header
+        if "DATE-AVG" in hdr0:
+            date = hdr0["DATE-AVG"].partition("T")[0]
+            pointing_x = str(hdr0["CRVAL1"])
+            pointing_y = str(hdr0["CRVAL2"])
+            for f in self.list:
+                hdr = f.file.header
+                time.append(hdr["DATE-AVG"].partition("T")[2])
+                cl.append(str(np.round(hdr["TWAVE1"], decimals=2)))
+                wwidth.append(hdr["WWIDTH1"])
+                shape.append(f._shape_str)
+                el.append(hdr["WDESC1"])
+        else:
+            date = hdr0["date_obs"]
+            pointing_x = str(hdr0["crval"][-1])
+            pointing_y = str(hdr0["crval"][-2])
+            for f in self.list:
+                hdr = f.file.header
+                time.append(hdr["time_obs"])
+                cl.append(str(hdr["crval"][-3]))
+                wwidth.append(str(hdr["dimensions"][-3]))
+                shape.append(f._shape_str)
+                el.append(hdr["element"])
+
+        return "\n".join(
+            (
+                "",
+                "        CRISP Observation",
+                "        ------------------",
+                f"        {date} {time}",
+                "",
+                f"        Observed: {el}",
+                f"        Centre wavelength: {cl}",
+                f"        Wavelengths sampled [{self.aa}]: {wwidth}",
+                f"        Pointing [arcsec] (HPLN, HPLT): ({pointing_x}, {pointing_y})",
+                f"        Shape: {shape}",
+            )
+        )
 
     @property
     def data(self) -> List[np.ndarray]:
@@ -782,7 +1062,7 @@ class CRISPSequence(CRISPSequenceSlicingMixin):
         """
         Returns a list of the wavelengths sampled in the observations.
         """
-        return [f.wave(np.arange(f.shape[-3])) for f in self.list]
+        return [f.wvls for f in self.list]
 
     @property
     def shape(self) -> List[Tuple]:
@@ -831,30 +1111,41 @@ class CRISPSequence(CRISPSequenceSlicingMixin):
             times. Default is False.
         """
         if diff_t:
+            # each frame derives its own rotation; the scipy rotations run
+            # in C with the GIL released, so a thread pool overlaps them
             if sep:
-                return [f.rotate_crop() for f in self.list]  # type: ignore
+                with ThreadPoolExecutor() as ex:
+                    return list(
+                        ex.map(lambda f: f.rotate_crop(), self.list)  # type: ignore
+                    )
 
             self.full_frame = [*self.data]
-            for f in self.list:
-                crop, crop_dict = f.rotate_crop(sep=True)  # type: ignore
+            with ThreadPoolExecutor() as ex:
+                results = list(
+                    ex.map(lambda f: f.rotate_crop(sep=True), self.list)  # type: ignore
+                )
+            for f, (crop, crop_dict) in zip(self.list, results):
                 f.file.data = crop
+                f._data_cache = None
                 for k, v in crop_dict.items():
                     f.file.header[k] = v
+                f._header_cache = None
+                f._shape_str_cache = None
                 f.rotate = True
         else:
+            data = [f.data for f in self.list]
             if sep:
-                return rotate_crop_aligned_data(self.list[0].data, self.list[1].data)
+                return rotate_crop_aligned_data(*data)
 
-            self.full_frame = [self.list[0].data, self.list[1].data]
-            crop_a, crop_b, crop_dict = rotate_crop_aligned_data(
-                self.list[0].data, self.list[1].data
-            )
-            self.list[0].file.data = crop_a
-            self.list[1].file.data = crop_b
-            for l in self.list[:2]:
+            self.full_frame = data
+            *crops, crop_dict = rotate_crop_aligned_data(*data)
+            for f, crop in zip(self.list, crops):
+                f.file.data = crop
+                f._data_cache = None
                 for k, v in crop_dict.items():
-                    l.file.header[k] = v
-            for f in self.list:
+                    f.file.header[k] = v
+                f._header_cache = None
+                f._shape_str_cache = None
                 f.rotate = True
         return None
 
@@ -870,12 +1161,20 @@ class CRISPSequence(CRISPSequenceSlicingMixin):
             changed in place with the original data being stored in the
             respective ``CRISP`` instances' ``rot_data`` attribute.
         """
+        # the per-frame derotations are independent and mostly GIL-free
+        # scipy work, so run them on a thread pool
         if sep:
-            return [f.reconstruct_full_frame(sep=True) for f in self.list]  # type: ignore
+            with ThreadPoolExecutor() as ex:
+                return list(
+                    ex.map(lambda f: f.reconstruct_full_frame(sep=True), self.list)  # type: ignore
+                )
 
-        for f in self.list:
+        def derotate(f: CRISP) -> None:
             f.reconstruct_full_frame(sep=False)
             f.rotate = False
+
+        with ThreadPoolExecutor() as ex:
+            list(ex.map(derotate, self.list))
         return None
 
     def plot_spectrum(
@@ -1069,6 +1368,65 @@ class CRISPSequence(CRISPSequenceSlicingMixin):
         """
         return self.list[0].to_lonlat(y, x)
 
+    def to_lonlat_all(
+        self, y: int, x: int, coord: bool = False, unit: bool = False
+    ) -> List[Tuple[float, float]]:
+        """
+        Converts a pixel position to world coordinates in every member
+        observation. Members whose pointing matches the first frame reuse its
+        transform result rather than going through the WCS machinery again.
+
+        Parameters
+        ----------
+        y : int
+            The y-index to be converted to Helioprojective Latitude.
+        x : int
+            The x-index to be converted to Helioprojective Longitude.
+        coord : bool, optional
+            Whether or not to return ```astropy.coordinates.SkyCoord```s. Default is False.
+        unit : bool, optional
+            Whether or not to return the values with associated ```astropy.units```. Default is False.
+
+        Returns
+        -------
+        list[tuple[float]]
+            The conversion result for each member observation, in order.
+        """
+        first = self.list[0].to_lonlat(y, x, coord=coord, unit=unit)
+        return [
+            first
+            if f is self.list[0] or _same_pointing(f, self.list[0])
+            else f.to_lonlat(y, x, coord=coord, unit=unit)
+            for f in self.list
+        ]
+
+    def from_lonlat_all(self, lon: float, lat: float) -> List[Tuple[int, int]]:
+        """
+        Converts a Helioprojective Longitude, Helioprojective Latitude pair to
+        the y, x indices of every member observation. Members whose pointing
+        matches the first frame reuse its transform result rather than going
+        through the WCS machinery again.
+
+        Parameters
+        ----------
+        lon : float
+            The Helioprojective Longitude in arcseconds.
+        lat : float
+            The Helioprojective Latitude in arcseconds.
+
+        Returns
+        -------
+        list[tuple[int]]
+            The (y, x) index pair for each member observation, in order.
+        """
+        first = self.list[0].from_lonlat(lon, lat)
+        return [
+            first
+            if f is self.list[0] or _same_pointing(f, self.list[0])
+            else f.from_lonlat(lon, lat)
+            for f in self.list
+        ]
+
 
 class CRISPWideband(CRISP):
     """
@@ -1083,31 +1441,33 @@ class CRISPWideband(CRISP):
     __doc__ += parameter_docstring(CRISP)
 
     def __str__(self) -> str:
-        try:
-            time = self.header["DATE-AVG"][-12:]
-            date = self.header["DATE-AVG"][:-13]
-            shape = str(
-                [self.header[f"NAXIS{j+1}"] for j in reversed(range(self.data.ndim))]
+        header = self.header
+        if self._new_schema:
+            date, _, time = header["DATE-AVG"].partition("T")
+            shape = self._shape_str
+            el = header["WDESC1"]
+            pointing_x = str(header["CRVAL1"])
+            pointing_y = str(header["CRVAL2"])
+        else:
+            time = header["time_obs"]
+            date = header["date_obs"]
+            shape = str(header["dimensions"])
+            el = header["element"]
+            pointing_x = str(header["crval"][-1])
+            pointing_y = str(header["crval"][-2])
+
+        return "\n".join(
+            (
+                "",
+                "        CRISP Wideband Context Image",
+                "        ------------------",
+                f"        {date} {time}",
+                "",
+                f"        Observed: {el}",
+                f"        Pointing: ({pointing_x}, {pointing_y})",
+                f"        Shape: {shape}",
             )
-            el = self.header["WDESC1"]
-            pointing_x = str(self.header["CRVAL1"])
-            pointing_y = str(self.header["CRVAL2"])
-        except KeyError:
-            time = self.header["time_obs"]
-            date = self.header["date_obs"]
-            shape = str(self.header["dimensions"])
-            el = self.header["element"]
-            pointing_x = str(self.header["crval"][-1])
-            pointing_y = str(self.header["crval"][-2])
-
-        return f"""
-        CRISP Wideband Context Image
-        ------------------
-        {date} {time}
-
-        Observed: {el}
-        Pointing: ({pointing_x}, {pointing_y})
-        Shape: {shape}"""
+        )
 
     def intensity_map(
         self, frame: Optional[str] = None, norm: Optional[str] = None
@@ -1124,38 +1484,20 @@ class CRISPWideband(CRISP):
         norm : matplotlib.colors.Normalize or None, optional
             The normalisation to use in the colourmap.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-            el = self.header["WDESC1"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-            el = self.header["element"]
+        datetime = self._datetime
+        el = self._el
 
         if frame is None:
             frame = "WCS"
         if frame == "WCS" and self.rotate:
             frame = "arcsec"
 
-        extent = None
-        if frame == "arcsec":
-            try:
-                xmax = self.header["CDELT1"] * self.shape[-1]
-                ymax = self.header["CDELT2"] * self.shape[-2]
-            except KeyError:
-                xmax = self.header["pixel_scale"] * self.shape[-1]
-                ymax = self.header["pixel_scale"] * self.shape[-2]
-            extent = [0.0, xmax, 0.0, ymax]
+        extent = self._frame_extent(frame)
 
         title = f"{datetime} {el} {self.aa} (wideband)"
 
-        def map_negative_nan(d):
-            if d.dtype != np.float32:
-                d = d.astype(np.float32)
-            d[d < 0.0] = np.nan
-            return d
-
         plot_single_frame(
-            self, frame, title, extent=extent, norm=norm, map_data=map_negative_nan
+            self, frame, title, extent=extent, norm=norm, map_data=_map_negative_nan
         )
 
 
@@ -1173,41 +1515,44 @@ class CRISPWidebandSequence(CRISPSequence):
         ``crispy.utils.CRISP_sequence_generator`` can be used to generate this list.
     """
 
-    def __init__(self, files: List[Dict]) -> None:
-        self.list = [CRISPWideband(**f) for f in files]
+    _frame_type = CRISPWideband
 
     def __str__(self) -> str:
-        try:
-            time = [f.file.header["DATE-AVG"][-12:] for f in self.list]
-            date = self.list[0].file.header["DATE-AVG"][:-13]
-            shape = [
-                str(
-                    [
-                        f.file.header[f"NAXIS{j+1}"]
-                        for j in reversed(range(f.file.data.ndim))
-                    ]
-                )
-                for f in self.list
-            ]
-            el = [f.file.header["WDESC1"] for f in self.list]
-            pointing_x = str(self.list[0].file.header["CRVAL1"])
-            pointing_y = str(self.list[0].file.header["CRVAL2"])
-        except KeyError:
-            time = [f.file.header["time_obs"] for f in self.list]
-            date = self.list[0].file.header["date_obs"]
-            shape = [str(f.file.header["dimensions"]) for f in self.list]
-            el = [self.list[0].file.header["element"] for f in self.list]
-            pointing_x = str(self.list[0].file.header["crval"][-1])
-            pointing_y = str(self.list[0].file.header["crval"][-2])
-
-        return f"""
-        CRISP Wideband Context Image
-        ------------------
-        {date} {time}
-
-        Observed: {el}
-        Pointing: ({pointing_x}, {pointing_y})
-        Shape: {shape}"""
+        hdr0 = self.list[0].file.header
+        time: List[str] = []
+        shape: List[str] = []
+        el: List[str] = []
+        if "DATE-AVG" in hdr0:
+            date = hdr0["DATE-AVG"].partition("T")[0]
+            pointing_x = str(hdr0["CRVAL1"])
+            pointing_y = str(hdr0["CRVAL2"])
+            for f in self.list:
+                hdr = f.file.header
+                time.append(hdr["DATE-AVG"].partition("T")[2])
+                shape.append(f._shape_str)
+                el.append(hdr["WDESC1"])
+        else:
+            date = hdr0["date_obs"]
+            pointing_x = str(hdr0["crval"][-1])
+            pointing_y = str(hdr0["crval"][-2])
+            for f in self.list:
+                hdr = f.file.header
+                time.append(hdr["time_obs"])
+                shape.append(f._shape_str)
+                el.append(hdr0["element"])
+
+        return "\n".join(
+            (
+                "",
+                "        CRISP Wideband Context Image",
+                "        ------------------",
+                f"        {date} {time}",
+                "",
+                f"        Observed: {el}",
+                f"        Pointing: ({pointing_x}, {pointing_y})",
+                f"        Shape: {shape}",
+            )
+        )
 
 class CRISPNonU(CRISP):
     def __init__(self, filename: Union[str, ObjDict], wcs: Optional[WCS] = None, uncertainty: Optional[np.ndarray] = None, mask: Optional[np.ndarray] = None, nonu: bool = False, wvl: Optional[u.Quantity] = None, orig_wvl: Optional[u.Quantity] = None) -> None:
@@ -1,14 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from typing import Union, Dict, Optional, Tuple
 import numpy as np
 import matplotlib.pyplot as plt
 import zarr
+from numcodecs import Blosc
 from matplotlib.colors import SymLogNorm
 from astropy.wcs import WCS
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from sunpy.coordinates import Helioprojective
 from .mixin import InversionSlicingMixin
-from .utils import ObjDict
+from .utils import ObjDict, mad_reduce
+
+# SymLogNorm builds its transform in __init__; this is a template that
+# _draw_map copies per render -- imshow only autoscales vmin/vmax while they
+# are None, so handing the same instance to several images would freeze the
+# first image's limits into all of them
+_VEL_NORM = SymLogNorm(1)
+
+# passing the frame class to SkyCoord instantiates a fresh default frame on
+# every call; one shared instance serves every from_lonlat conversion
+_HPC_FRAME = Helioprojective()
 
 rc_context_dict = {
     # "figure.constrained_layout.use" : True,
@@ -43,6 +56,17 @@ class Inversion(InversionSlicingMixin):
     wcs : astropy.wcs.WCS or None, optional
         The WCS of the observation associated with the inversions. Default is
         None, the WCS is inferred from the inversion and header.
+    lazy : bool, optional
+        Whether or not to leave the atmospheric parameters on disk and only
+        read the slices that are needed (e.g. one z-plane for the ``*_map``
+        methods). Default is True. Set to False to read the full cubes into
+        memory up front which can be faster when the whole inversion is going
+        to be used anyway.
+    cache_size : int or None, optional
+        The size in bytes of an LRU chunk cache to wrap around the zarr store.
+        Repeated reads of nearby slices (e.g. scrubbing through consecutive
+        z planes) then come out of memory instead of re-reading and
+        decompressing the chunks. Default is None, no cache.
     """
 
     def __init__(
@@ -51,111 +75,307 @@ class Inversion(InversionSlicingMixin):
         header: Dict,
         z: Optional[Union[str, np.ndarray]] = None,
         wcs: Optional[WCS] = None,
+        lazy: bool = True,
+        cache_size: Optional[int] = None,
     ) -> None:
+        self._handles: Dict = {}
+        self._datetime: Optional[str] = None
+        self._height: Optional[np.ndarray] = None
+        self._coord_wcs_cache: Optional[WCS] = None
+        # the slicing mixin overwrites this after construction; None means
+        # the object still spans the full inversion
+        self.ind = None
         if isinstance(filename, str):
-            self.f = zarr.open(filename, mode="r")
-            if isinstance(z, str):
-                self.z = zarr.open(z, mode="r")["z"][:]
-            elif z is None:
-                self.z = self.f["/atmos/z"]
-            else:
-                self.z = z
-            if wcs is None:
-                self.wcs = self._inversion_wcs(header)
-            else:
-                self.wcs = wcs
-            self.header = header
+            self._load_zarr(filename, header, z, wcs, lazy, cache_size)
         elif isinstance(filename, ObjDict):
-            self.f = filename
-            if isinstance(z, str):
-                self.z = zarr.open(z, mode="r")["z"][:]
-            elif z is None:
-                self.z = filename["z"]
-            else:
-                self.z = z
-            if wcs is None:
-                self.wcs = self._inversion_wcs(header)
+            self._load_objdict(filename, header, z, wcs)
+        # the low-level WCS is resolved through a property on every access;
+        # grab it once here for the plotting methods
+        self._world = self.wcs.low_level_wcs
+        # which header dialect the inversion carries: FITS keywords or the
+        # legacy zarr attribute names, probed once so per-call paths can
+        # branch on a bool instead of catching KeyError
+        self._new_schema = "DATE-AVG" in self.header
+
+    def _load_zarr(
+        self,
+        filename: str,
+        header: Dict,
+        z: Optional[Union[str, np.ndarray]],
+        wcs: Optional[WCS],
+        lazy: bool,
+        cache_size: Optional[int] = None,
+    ) -> None:
+        """
+        Constructor branch for inversions backed by a zarr store on disk.
+        """
+        if cache_size is not None:
+            store = zarr.LRUStoreCache(
+                zarr.DirectoryStore(filename), max_size=cache_size
+            )
+            self.f = zarr.open(store, mode="r")
+        else:
+            self.f = zarr.open(filename, mode="r")
+        if isinstance(z, str):
+            self.z = zarr.open(z, mode="r")["z"][:]
+        elif z is None:
+            self.z = self.f["/atmos/z"][:]
+        else:
+            self.z = z
+        if not lazy:
+            # single precision is ample for RADYNVERSION output and
+            # halves the memory footprint of an eagerly-loaded inversion
+            def read(key: str) -> np.ndarray:
+                return self.f["/atmos/" + key][:].astype(np.float32, copy=False)
+
+            keys = (
+                "ne",
+                "temperature",
+                "vel",
+                "ne_err",
+                "temperature_err",
+                "vel_err",
+            )
+            # the bulk reads are mostly decompression which releases the
+            # GIL, so issuing them on a thread pool overlaps the work
+            with ThreadPoolExecutor(max_workers=len(keys)) as ex:
+                arrays = list(ex.map(read, keys))
+            self.f = ObjDict(dict(zip(keys, arrays)))
+        if wcs is None:
+            self.wcs = self._inversion_wcs(header)
+        else:
+            self.wcs = wcs
+        self.header = header
+
+    def _load_objdict(
+        self,
+        filename: ObjDict,
+        header: Dict,
+        z: Optional[Union[str, np.ndarray]],
+        wcs: Optional[WCS],
+    ) -> None:
+        """
+        Constructor branch for inversions already held in memory as an
+        ``crispy.utils.ObjDict`` e.g. those produced by slicing.
+        """
+        self.f = filename
+        if isinstance(z, str):
+            self.z = zarr.open(z, mode="r")["z"][:]
+        elif z is None:
+            self.z = filename["z"]
+        else:
+            self.z = z
+        if wcs is None:
+            self.wcs = self._inversion_wcs(header)
+        else:
+            self.wcs = wcs
+        self.header = header
+
+    def close(self) -> None:
+        """
+        Releases the handle on the underlying zarr store. This is a no-op for
+        plain directory stores but matters for stores that hold resources
+        (e.g. zip stores) and lets batch scripts over many inversions release
+        them deterministically. The object should not be used afterwards.
+        """
+        f = getattr(self, "f", None)
+        if f is None or isinstance(f, ObjDict):
+            return
+        self._handles.clear()
+        try:
+            f.store.close()
+        except AttributeError:
+            pass
+
+    def __enter__(self) -> "Inversion":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _atmos(self, key: str):
+        """
+        Returns the array handle for an atmospheric parameter, caching the
+        group lookup so repeated slicing does not re-walk the zarr hierarchy.
+        """
+        try:
+            return self._handles[key]
+        except KeyError:
+            if isinstance(self.f, ObjDict):
+                arr = self.f[key]
             else:
-                self.wcs = wcs
-            self.header = header
+                arr = self.f["/atmos/" + key]
+            self._handles[key] = arr
+            return arr
 
     @property
     def ne(self):
         """
         Returns the electron number density in the inversion.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["ne"]
-        else:
-            return self.f["/atmos/ne"]
+        return self._atmos("ne")
 
     @property
     def temp(self):
         """
         Returns the electron temperature in the inversion.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["temperature"]
-        else:
-            return self.f["/atmos/temperature"]
+        return self._atmos("temperature")
 
     @property
     def vel(self):
         """
         Returns the bulk velocity flow in the inversion.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["vel"]
-        else:
-            return self.f["/atmos/vel"]
+        return self._atmos("vel")
 
     @property
     def ne_err(self):
         """
         Returns the errors on the electron number density.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["ne_err"]
-        else:
-            return self.f["/atmos/ne_err"]
+        return self._atmos("ne_err")
 
     @property
     def temp_err(self):
         """
         Returns the errors on the electron temperature.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["temperature_err"]
-        else:
-            return self.f["/atmos/temperature_err"]
+        return self._atmos("temperature_err")
 
     @property
     def vel_err(self):
         """
         Returns the errors on the bulk velocity flow.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["vel_err"]
-        else:
-            return self.f["/atmos/vel_err"]
+        return self._atmos("vel_err")
 
-    def __str__(self) -> str:
-        try:
-            time = self.header["DATE-AVG"][-12:]
-            date = self.header["DATE-AVG"][:-13]
-            pointing_x = str(self.header["CRVAL1"])
-            pointing_y = str(self.header["CRVAL2"])
-        except KeyError:
-            time = self.header["time_obs"]
-            date = self.header["date_obs"]
-            pointing_x = str(self.header["crval"][-1])
-            pointing_y = str(self.header["crval"][-2])
+    def err_summary(self) -> ObjDict:
+        """
+        Computes per-pixel summaries of the inversion errors: the median
+        absolute deviation of each error profile over the height grid. This
+        gives a robust map of how well constrained each pixel of the inversion
+        is without being skewed by single badly-fit heights. The reduction is
+        compiled with Numba (see ``crispy.utils.mad_reduce``).
+
+        Returns
+        -------
+        summary : crispy.utils.ObjDict
+            The median absolute deviation maps with keys "ne_err",
+            "temperature_err" and "vel_err".
+        """
+        return ObjDict(
+            {
+                "ne_err": mad_reduce(np.asarray(self.ne_err)),
+                "temperature_err": mad_reduce(np.asarray(self.temp_err)),
+                "vel_err": mad_reduce(np.asarray(self.vel_err)),
+            }
+        )
+
+    def rechunk(
+        self, path: str, chunks: Optional[Tuple[int, int, int]] = None
+    ) -> None:
+        """
+        Rewrites the inversion to a new zarr store with a chunk layout that
+        suits both access patterns used by the class: the ``plot_*`` methods
+        read a z-profile at fixed (y,x) while the ``*_map`` methods read a
+        whole (y,x) plane at fixed z. Chunks spanning the full height grid but
+        tiled in the image plane serve both without reading the whole cube.
+
+        Parameters
+        ----------
+        path : str
+            The path to write the rechunked zarr store to.
+        chunks : tuple[int] or None, optional
+            The chunk shape to use for the atmospheric parameters. Default is
+            None which uses (Nz, 64, 64) i.e. full columns in z tiled 64x64
+            over the field-of-view.
+        """
+        if chunks is None:
+            chunks = (self.ne.shape[0], 64, 64)
+
+        self._write_zarr(path, chunks=chunks)
+
+    def save(self, path: str, compressor: Optional[Blosc] = None) -> None:
+        """
+        Writes the inversion to a new zarr store with bitshuffled LZ4
+        compression. Bitshuffle groups the bits of neighbouring floats before
+        compression which both shrinks the file and cuts the time spent
+        reading the atmospheric parameters back in.
+
+        Parameters
+        ----------
+        path : str
+            The path to write the zarr store to.
+        compressor : numcodecs.Blosc or None, optional
+            The compressor to apply to the atmospheric parameters. Default is
+            None which uses LZ4 with bitshuffle.
+        """
+        if compressor is None:
+            compressor = Blosc(cname="lz4", shuffle=Blosc.BITSHUFFLE)
+
+        self._write_zarr(path, compressor=compressor)
+
+    def _write_zarr(
+        self,
+        path: str,
+        chunks: Optional[Tuple[int, int, int]] = None,
+        compressor: Optional[Blosc] = None,
+    ) -> None:
+        if isinstance(self.f, ObjDict):
+            raise ValueError(
+                "Can only rewrite an Inversion backed by a zarr file."
+            )
 
-        return f"""Inversion
-        ------------------
-        {date} {time}
+        kwargs = {}
+        if compressor is not None:
+            kwargs["compressor"] = compressor
+
+        out = zarr.open(path, mode="w")
+        for key in (
+            "ne",
+            "temperature",
+            "vel",
+            "ne_err",
+            "temperature_err",
+            "vel_err",
+        ):
+            arr = self.f["/atmos/" + key]
+            out.array(
+                "atmos/" + key,
+                arr[:],
+                chunks=chunks if chunks is not None else arr.chunks,
+                **kwargs,
+            )
+        out.array("atmos/z", np.asarray(self.z))
 
-        Pointing: ({pointing_x}, {pointing_y})"""
+    def __str__(self) -> str:
+        header = self.header
+        if self._new_schema:
+            date, _, time = header["DATE-AVG"].partition("T")
+            pointing_x = str(header["CRVAL1"])
+            pointing_y = str(header["CRVAL2"])
+        else:
+            time = header["time_obs"]
+            date = header["date_obs"]
+            pointing_x = str(header["crval"][-1])
+            pointing_y = str(header["crval"][-2])
+
+        return "\n".join(
+            (
+                "Inversion",
+                "        ------------------",
+                f"        {date} {time}",
+                "",
+                f"        Pointing: ({pointing_x}, {pointing_y})",
+            )
+        )
 
     def _inversion_wcs(self, header: Dict) -> WCS:
 
@@ -212,6 +432,48 @@ class Inversion(InversionSlicingMixin):
 
         return WCS(wcs_dict)
 
+    def _get_datetime(self) -> str:
+        """
+        Returns the datetime string used in plot titles, parsing the header
+        only on the first call.
+        """
+        if self._datetime is None:
+            # get avoids raising (and formatting a traceback for) KeyError
+            # on every legacy header without DATE-AVG
+            date_avg = self.header.get("DATE-AVG")
+            if date_avg is not None:
+                self._datetime = date_avg
+            else:
+                self._datetime = (
+                    self.header["date_obs"] + "T" + self.header["time_obs"]
+                )
+        return self._datetime
+
+    def _get_height(self) -> np.ndarray:
+        """
+        Returns the height grid rounded for use in plot titles, computed once
+        per instance rather than in every map method.
+        """
+        if self._height is None:
+            self._height = np.round(self.z, decimals=4)
+        return self._height
+
+    def _plot_profile(
+        self, ax, y, yerr, ylabel: str, title: str, eb: bool = False
+    ) -> None:
+        """
+        Plots one atmospheric quantity against the height grid on the given
+        axis, optionally with its median absolute deviation as errorbars. This
+        is the shared body of the ``plot_*`` methods.
+        """
+        if eb:
+            ax.errorbar(self.z, y, yerr=yerr, capsize=3)
+        else:
+            ax.plot(self.z, y)
+        ax.set_ylabel(ylabel)
+        ax.set_xlabel("z [Mm]")
+        ax.set_title(title)
+
     @plt.rc_context(rc_context_dict)
     def plot_ne(self, eb: bool = False) -> None:
         """
@@ -225,21 +487,18 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) for the
             electron number density as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        datetime = self._get_datetime()
 
         title = f"{datetime}"
         fig = plt.figure()
-        ax1 = fig.gca()
-        if eb:
-            ax1.errorbar(self.z, self.ne, yerr=self.ne_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.ne)
-        ax1.set_ylabel(r"log$_{10}$ n$_{\text{e}}$ \[cm$^{-3}$\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title(f"Electron Number Density {title}")
+        self._plot_profile(
+            fig.gca(),
+            self.ne,
+            self.ne_err,
+            r"log$_{10}$ n$_{\text{e}}$ \[cm$^{-3}$\]",
+            f"Electron Number Density {title}",
+            eb=eb,
+        )
         fig.show()
 
     @plt.rc_context(rc_context_dict)
@@ -254,21 +513,18 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) of the
             estimated electron temperatures as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        datetime = self._get_datetime()
 
         title = f"{datetime}"
         fig = plt.figure()
-        ax1 = fig.gca()
-        if eb:
-            ax1.errorbar(self.z, self.temp, yerr=self.temp_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.temp)
-        ax1.set_ylabel(r"log$_{10}$ T \[K\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title(f"Electron Temperature {title}")
+        self._plot_profile(
+            fig.gca(),
+            self.temp,
+            self.temp_err,
+            r"log$_{10}$ T \[K\]",
+            f"Electron Temperature {title}",
+            eb=eb,
+        )
         fig.show()
 
     @plt.rc_context(rc_context_dict)
@@ -283,21 +539,18 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) of the
             bulk velocity as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        datetime = self._get_datetime()
 
         title = f"{datetime}"
         fig = plt.figure()
-        ax1 = fig.gca()
-        if eb:
-            ax1.errorbar(self.z, self.vel, yerr=self.vel_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.vel)
-        ax1.set_ylabel(r"Bulk Plasma Flow \[km s$^{-1}$\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title(f"Bulk Plasma Flow {title}")
+        self._plot_profile(
+            fig.gca(),
+            self.vel,
+            self.vel_err,
+            r"Bulk Plasma Flow \[km s$^{-1}$\]",
+            f"Bulk Plasma Flow {title}",
+            eb=eb,
+        )
         fig.show()
 
     @plt.rc_context(rc_context_dict)
@@ -313,44 +566,111 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) for each
             estimated quantity as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        datetime = self._get_datetime()
 
         title = f"{datetime}"
         fig = plt.figure()
         fig.suptitle(title)
-        ax1 = fig.add_subplot(1, 3, 1)
-        if eb:
-            ax1.errorbar(self.z, self.ne, yerr=self.ne_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.ne)
-        ax1.set_ylabel(r"log$_{10}$ n$_{e}$ \[cm$^{-3}$\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title("Electron Number Density")
+        self._plot_profile(
+            fig.add_subplot(1, 3, 1),
+            self.ne,
+            self.ne_err,
+            r"log$_{10}$ n$_{e}$ \[cm$^{-3}$\]",
+            "Electron Number Density",
+            eb=eb,
+        )
+        self._plot_profile(
+            fig.add_subplot(1, 3, 2),
+            self.temp,
+            self.temp_err,
+            r"log$_{10}$ T \[K\]",
+            "Electron Temperature",
+            eb=eb,
+        )
+        self._plot_profile(
+            fig.add_subplot(1, 3, 3),
+            self.vel,
+            self.vel_err,
+            r"Bulk Plasma Flow \[km s$^{-1}\]",
+            "Bulk Plasma Flow",
+            eb=eb,
+        )
+        fig.show()
 
-        ax2 = fig.add_subplot(1, 3, 2)
-        if eb:
-            ax2.errorbar(self.z, self.temp, yerr=self.temp_err, capsize=3)
-        else:
-            ax2.plot(self.z, self.temp)
-        ax2.set_ylabel(r"log$_{10}$ T \[K\]")
-        ax2.set_xlabel("z [Mm]")
-        ax2.set_title("Electron Temperature")
+    # kind -> (quantity key, cmap, norm, display name, colorbar label)
+    _MAP_SPECS = {
+        "ne": (
+            "ne",
+            "cividis",
+            None,
+            "Electron Number Density",
+            r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
+        ),
+        "temp": (
+            "temperature",
+            "hot",
+            None,
+            "Electron Temperature",
+            r"log$_{10}$T [K]",
+        ),
+        "vel": (
+            "vel",
+            "RdBu",
+            _VEL_NORM,
+            "Bulk Velocity Flow",
+            r"v [kms$^{-1}$]",
+        ),
+    }
+
+    def _draw_map(self, ax, kind: str, rgba: bool = False):
+        """
+        Reads the plane for one atmospheric quantity and draws it on the given
+        axis, returning the image for colorbar attachment.
+        """
+        key, cmap, norm, _, _ = self._MAP_SPECS[kind]
+        if norm is not None:
+            # each image must autoscale independently (and on matplotlib
+            # >= 3.6 a shared norm would link the colour limits of every
+            # open figure), so render with a copy of the template
+            norm = copy(norm)
+        data = np.asarray(self._atmos(key))
+        if rgba:
+            scale = plt.Normalize() if norm is None else norm
+            data = plt.get_cmap(cmap)(scale(data))
+            return ax.imshow(data, interpolation="nearest")
+        kwargs = {"cmap": cmap, "interpolation": "nearest"}
+        if norm is not None:
+            kwargs["norm"] = norm
+        return ax.imshow(data, **kwargs)
 
-        ax3 = fig.add_subplot(1, 3, 3)
-        if eb:
-            ax3.errorbar(self.z, self.vel, yerr=self.vel_err, capsize=3)
+    @plt.rc_context(rc_context_dict)
+    def _map(
+        self, kind: str, frame: Optional[str] = None, rgba: bool = False
+    ) -> None:
+        """
+        Shared implementation of the single-quantity ``*_map`` methods, driven
+        by the ``_MAP_SPECS`` table.
+        """
+        height = self._get_height()
+        datetime = self._get_datetime()
+        _, _, _, name, cbar_label = self._MAP_SPECS[kind]
+
+        fig = plt.figure()
+        if frame is None:
+            ax1 = fig.add_subplot(1, 1, 1, projection=self._world)
+            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
+            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
         else:
-            ax3.plot(self.z, self.vel)
-        ax3.set_ylabel(r"Bulk Plasma Flow \[km s$^{-1}\]")
-        ax3.set_xlabel("z [Mm]")
-        ax3.set_title("Bulk Plasma Flow")
+            ax1 = fig.gca()
+            ax1.set_ylabel("y [pixels]")
+            ax1.set_xlabel("x [pixels]")
+        im1 = self._draw_map(ax1, kind, rgba=rgba)
+        ax1.set_title(f"{name} {datetime} z={height}Mm")
+        if not rgba:
+            fig.colorbar(im1, ax=ax1, label=cbar_label)
         fig.show()
 
-    @plt.rc_context(rc_context_dict)
-    def ne_map(self, frame: Optional[str] = None) -> None:
+    def ne_map(self, frame: Optional[str] = None, rgba: bool = False) -> None:
         """
         Creates an electron density map at a specified height denoted in the
         ``Inversion`` slice.
@@ -360,34 +680,16 @@ class Inversion(InversionSlicingMixin):
         frame : str, optional
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
+        rgba : bool, optional
+            Whether or not to apply the colormap to the plane up front and
+            render the resulting RGBA image, which makes interactive redraws
+            much cheaper. No colorbar is drawn in this mode. Default is False.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-
-        if frame is None:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title(f"Electron Number Density {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.gca()
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title(f"Electron Number Density {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]")
-            fig.show()
+        self._map("ne", frame=frame, rgba=rgba)
 
-    @plt.rc_context(rc_context_dict)
-    def temp_map(self, frame: Optional[str] = None) -> None:
+    def temp_map(
+        self, frame: Optional[str] = None, rgba: bool = False
+    ) -> None:
         """
         Creates an electron temperature map at a specified height denoted in the
         ``Inversion`` slice.
@@ -397,33 +699,14 @@ class Inversion(InversionSlicingMixin):
         frame : str, optional
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
+        rgba : bool, optional
+            Whether or not to apply the colormap to the plane up front and
+            render the resulting RGBA image, which makes interactive redraws
+            much cheaper. No colorbar is drawn in this mode. Default is False.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-        if frame is None:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.temp, cmap="hot")
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title(f"Electron Temperature {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$T [K]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.gca()
-            im1 = ax1.imshow(self.temp, cmap="cividis")
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title(f"Electron Temperature {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$T [K]")
-            fig.show()
+        self._map("temp", frame=frame, rgba=rgba)
 
-    @plt.rc_context(rc_context_dict)
-    def vel_map(self, frame: Optional[str] = None) -> None:
+    def vel_map(self, frame: Optional[str] = None, rgba: bool = False) -> None:
         """
         Creates a bulk velocity map at a specified height denoted in the
         ``Inversion`` slice.
@@ -433,30 +716,12 @@ class Inversion(InversionSlicingMixin):
         frame : str, optional
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
+        rgba : bool, optional
+            Whether or not to apply the colormap to the plane up front and
+            render the resulting RGBA image, which makes interactive redraws
+            much cheaper. No colorbar is drawn in this mode. Default is False.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-        if frame is None:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"v [kms$^{-1}$]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.gca()
-            im1 = ax1.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"v [kms$^{-1}$]")
-            fig.show()
+        self._map("vel", frame=frame, rgba=rgba)
 
     @plt.rc_context(rc_context_dict)
     def params_map(self, frame: Optional[str] = None) -> None:
@@ -470,70 +735,66 @@ class Inversion(InversionSlicingMixin):
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        height = self._get_height()
+        datetime = self._get_datetime()
+
+        fig = plt.figure()
         if frame is None:
-            fig = plt.figure()
             fig.suptitle(f"{datetime} z={np.round(height,3)}Mm")
-            ax1 = fig.add_subplot(1, 3, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title("Electron Number Density")
-            fig.colorbar(
-                im1,
-                ax=ax1,
-                orientation="vertical",
-                label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
-            )
+        for i, kind in enumerate(("ne", "temp", "vel")):
+            _, _, _, name, cbar_label = self._MAP_SPECS[kind]
+            if frame is None:
+                ax = fig.add_subplot(1, 3, i + 1, projection=self._world)
+                if i == 0:
+                    ax.set_ylabel("Helioprojective Latitude [arcsec]")
+                else:
+                    ax.set_ylabel(" ")
+                    ax.tick_params(axis="y", labelleft=False)
+                ax.set_xlabel("Helioprojective Longitude [arcsec]")
+            else:
+                ax = fig.add_subplot(1, 3, i + 1)
+                if i == 0:
+                    ax.set_ylabel("y [pixels]")
+                else:
+                    ax.set_yticks([])
+                ax.set_xlabel("x [pixels]")
+            im = self._draw_map(ax, kind)
+            ax.set_title(name)
+            fig.colorbar(im, ax=ax, orientation="vertical", label=cbar_label)
+        fig.show()
 
-            ax2 = fig.add_subplot(1, 3, 2, projection=self.wcs.low_level_wcs)
-            im2 = ax2.imshow(self.temp, cmap="hot")
-            ax2.set_ylabel(" ")
-            ax2.tick_params(axis="y", labelleft=False)
-            ax2.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax2.set_title("Electron Temperature")
-            fig.colorbar(im2, ax=ax2, orientation="vertical", label=r"log$_{10}$T [K]")
-
-            ax3 = fig.add_subplot(1, 3, 3, projection=self.wcs.low_level_wcs)
-            im3 = ax3.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax3.set_ylabel(" ")
-            ax3.tick_params(axis="y", labelleft=False)
-            ax3.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax3.set_title("Bulk Velocity Flow")
-            fig.colorbar(im3, ax=ax3, orientation="vertical", label=r"v [kms$^{-1}$]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 3, 1)
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title("Electron Number Density")
-            fig.colorbar(
-                im1,
-                ax=ax1,
-                orientation="vertical",
-                label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
-            )
+    @property
+    def _coord_wcs(self) -> WCS:
+        """
+        The two-dimensional WCS used for pixel<->world conversions, with
+        any slicing applied to this object already resolved. Slicing an
+        astropy WCS allocates a fresh object every time and ``self.ind``
+        never changes once set, so the resolved WCS is computed once and
+        shared by ``to_lonlat`` and ``from_lonlat``.
+        """
+        if self._coord_wcs_cache is None:
+            self._coord_wcs_cache = self._resolve_coord_wcs()
+        return self._coord_wcs_cache
 
-            ax2 = fig.add_subplot(1, 3, 2)
-            im2 = ax2.imshow(self.temp, cmap="hot")
-            ax2.set_yticks([])
-            ax2.set_xlabel("x [pixels]")
-            ax2.set_title("Electron Temperature")
-            fig.colorbar(im2, ax=ax2, orientation="vertical", label=r"log$_{10}$T [K]")
-
-            ax3 = fig.add_subplot(1, 3, 3)
-            im3 = ax3.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax3.set_yticks([])
-            ax3.set_xlabel("x [pixels]")
-            ax3.set_title("Bulk Velocity Flow")
-            fig.colorbar(im3, ax=ax3, orientation="vertical", label=r"v [kms$^{-1}$]")
-            fig.show()
+    def _resolve_coord_wcs(self) -> WCS:
+        """
+        Reduce the object's WCS to the two spatial dimensions, dropping the
+        leading axes and applying the spatial part of ``self.ind``.
+        """
+        llw = self.wcs.low_level_wcs
+        rank = len(llw.array_shape)
+        if rank == 2:
+            return self.wcs
+        if rank not in (3, 4):
+            raise NotImplementedError("Too many or too little dimensions.")
+        if self.ind is not None:
+            # integer entries have already collapsed their axis in the data,
+            # so the matching world axis keeps its full extent
+            key = (0,) * (llw._wcs.naxis - 2) + tuple(
+                s if isinstance(s, slice) else slice(None) for s in self.ind[-2:]
+            )
+            return llw._wcs[key]
+        return self.wcs[(0,) * (rank - 2)]
 
     def to_lonlat(
         self, y: int, x: int, coord: bool = False, unit: bool = False
@@ -553,280 +814,12 @@ class Inversion(InversionSlicingMixin):
         x : int
             The x-index to be converted to Helioprojective Longitude.
         """
+        sc = self._coord_wcs.array_index_to_world(y, x)
         if coord:
-            if len(self.wcs.low_level_wcs.array_shape) == 4:
-                if hasattr(self, "ind"):
-                    if isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2], self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    elif isinstance(self.ind[-2], slice) and not isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2]
-                        ].array_index_to_world(y, x)
-                    elif not isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, :, self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    else:
-                        return self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                            y, x
-                        )
-                else:
-                    return self.wcs[0, 0].array_index_to_world(y, x)
-            elif len(self.wcs.low_level_wcs.array_shape) == 3:
-                if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                    if isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2], self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    elif isinstance(self.ind[-2], slice) and not isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2]
-                        ].array_index_to_world(y, x)
-                    elif not isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, :, self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    else:
-                        return self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                            y, x
-                        )
-                else:
-                    if hasattr(self, "ind"):
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            return self.wcs.low_level_wcs._wcs[
-                                0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            return self.wcs.low_level_wcs._wcs[
-                                0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            return self.wcs.low_level_wcs._wcs[
-                                0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                        else:
-                            return self.wcs.low_level_wcs._wcs[0].array_index_to_world(
-                                y, x
-                            )
-                    else:
-                        return self.wcs[0].array_index_to_world(y, x)
-            elif len(self.wcs.low_level_wcs.array_shape) == 2:
-                return self.wcs.array_index_to_world(y, x)
-            else:
-                raise NotImplementedError("Too many or too little dimensions.")
-        else:
-            if unit:
-                if len(self.wcs.low_level_wcs.array_shape) == 4:
-                    if hasattr(self, "ind"):
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx, sc.Ty
-                    else:
-                        sc = self.wcs[0, 0].array_index_to_world(y, x)
-                        return sc.Tx, sc.Ty
-                elif len(self.wcs.low_level_wcs.array_shape) == 3:
-                    if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx, sc.Ty
-                    else:
-                        if hasattr(self, "ind"):
-                            if isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2], self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                            elif isinstance(self.ind[-2], slice) and not isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                            elif not isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, :, self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                            else:
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                        else:
-                            sc = self.wcs[0].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                elif len(self.wcs.low_level_wcs.array_shape) == 2:
-                    sc = self.wcs.array_index_to_world(y, x)
-                    return sc.Tx, sc.Ty
-                else:
-                    raise NotImplementedError("Too many or too little dimensions.")
-            else:
-                if len(self.wcs.low_level_wcs.array_shape) == 4:
-                    if hasattr(self, "ind"):
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx.value, sc.Ty.value
-                    else:
-                        sc = self.wcs[0, 0].array_index_to_world(y, x)
-                        return sc.Tx.value, sc.Ty.value
-                elif len(self.wcs.low_level_wcs.array_shape) == 3:
-                    if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx.value, sc.Ty.value
-                    else:
-                        if hasattr(self, "ind"):
-                            if isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2], self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                            elif isinstance(self.ind[-2], slice) and not isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                            elif not isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, :, self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                            else:
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                        else:
-                            sc = self.wcs[0].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                elif len(self.wcs.low_level_wcs.array_shape) == 2:
-                    sc = self.wcs.array_index_to_world(y, x)
-                    return sc.Tx.value, sc.Ty.value
-                else:
-                    raise NotImplementedError("Too many or too little dimensions.")
+            return sc
+        if unit:
+            return sc.Tx, sc.Ty
+        return sc.Tx.value, sc.Ty.value
 
     def from_lonlat(self, lon: float, lat: float) -> Tuple[float]:
         """
@@ -845,74 +838,5 @@ class Inversion(InversionSlicingMixin):
             The Helioprojective Latitude in arcseconds.
         """
         lon, lat = lon << u.arcsec, lat << u.arcsec
-        sc = SkyCoord(lon, lat, frame=Helioprojective)
-        if len(self.wcs.low_level_wcs.array_shape) == 4:
-            if hasattr(self, "ind"):
-                if isinstance(self.ind[-2], slice) and isinstance(self.ind[-1], slice):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2], self.ind[-1]
-                    ].world_to_array_index(sc)
-                elif isinstance(self.ind[-2], slice) and not isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2]
-                    ].world_to_array_index(sc)
-                elif not isinstance(self.ind[-2], slice) and isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, :, self.ind[-1]
-                    ].world_to_array_index(sc)
-                else:
-                    return self.wcs.low_level_wcs._wcs[0, 0].world_to_array_index(sc)
-            else:
-                return self.wcs[0, 0].world_to_array_index(lon, lat)
-        elif len(self.wcs.low_level_wcs.array_shape) == 3:
-            if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                if isinstance(self.ind[-2], slice) and isinstance(self.ind[-1], slice):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2], self.ind[-1]
-                    ].world_to_array_index(sc)
-                elif isinstance(self.ind[-2], slice) and not isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2]
-                    ].world_to_array_index(sc)
-                elif not isinstance(self.ind[-2], slice) and isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, :, self.ind[-1]
-                    ].world_to_array_index(sc)
-                else:
-                    return self.wcs.low_level_wcs._wcs[0, 0].world_to_array_index(sc)
-            else:
-                if hasattr(self, "ind"):
-                    if isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, self.ind[-2], self.ind[-1]
-                        ].world_to_array_index(sc)
-                    elif isinstance(self.ind[-2], slice) and not isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, self.ind[-2]
-                        ].world_to_array_index(sc)
-                    elif not isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, :, self.ind[-1]
-                        ].world_to_array_index(sc)
-                    else:
-                        return self.wcs.low_level_wcs._wcs[0].world_to_array_index(sc)
-                else:
-                    return self.wcs[0].world_to_array_index(sc)
-        elif len(self.wcs.low_level_wcs.array_shape) == 2:
-            return self.wcs.world_to_array_index(sc)
-        else:
-            raise NotImplementedError("Too many or too little dimensions.")
+        sc = SkyCoord(lon, lat, frame=_HPC_FRAME)
+        return self._coord_wcs.world_to_array_index(sc)
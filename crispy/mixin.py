@@ -46,7 +46,10 @@ class CRISPSlicingMixin(NDSlicingMixin):
         kwargs["uncertainty"] = self._slice_uncertainty(item)
         kwargs["mask"] = self._slice_mask(item)
         kwargs["wcs"] = self._slice_wcs(item)
-        kwargs["filename"]["header"] = self.header
+        # copy so the slice owns its header: rotate_crop and
+        # reconstruct_full_frame mutate file.header in place, which must not
+        # reach the parent's cached header or any sibling slice
+        kwargs["filename"]["header"] = dict(self.header)
         kwargs["nonu"] = self.nonu
         try:
             wave_idx = len(self.wcs.array_shape) - self.wcs.world_axis_physical_types.index('em.wl') - 1
@@ -2,7 +2,7 @@ import numpy as np
 from scipy.ndimage import rotate
 from cycler import cycler
 from tqdm import tqdm
-from numba import njit
+from numba import njit, prange
 
 
 class ObjDict(dict):
@@ -205,6 +205,36 @@ def scanline_search_corners(im, size=10):
     return corners
 
 
+@njit(cache=True, parallel=True)
+def mad_reduce(cube):
+    """
+    Computes the median absolute deviation along the first axis of a cube,
+    giving a per-pixel summary of how spread a quantity is over that axis
+    (e.g. the inversion errors over the height grid). The loop over the image
+    plane is compiled and parallelised with Numba which is considerably faster
+    than the equivalent broadcasting expression for large fields-of-view.
+
+    Parameters
+    ----------
+    cube : numpy.ndarray
+        3D array to reduce over its first axis.
+
+    Returns
+    -------
+    mad : numpy.ndarray
+        2D array of the median absolute deviation of each (y,x) column of the
+        cube.
+    """
+    ny, nx = cube.shape[1], cube.shape[2]
+    mad = np.zeros((ny, nx), dtype=np.float64)
+    for j in prange(ny):
+        for i in range(nx):
+            column = cube[:, j, i].copy()
+            med = np.median(column)
+            mad[j, i] = np.median(np.abs(column - med))
+    return mad
+
+
 def towards_centroid(vec, centroid, dist=2):
     """
     Moves a point towards another point by a certain distance
@@ -387,26 +417,24 @@ def find_unified_bb(imA, imB):
     return finalCorners
 
 
-def rotate_crop_aligned_data(imA, imB):
+def rotate_crop_aligned_data(*ims):
     """
-    Rotate and crop a unified section of data from images in two different
-    wavebands.
+    Rotate and crop a unified section of data from co-aligned images in an
+    arbitrary number of wavebands. The rotation angle and crop box are
+    computed once from the unified bounding box of every frame and then
+    applied to each cube, rather than re-deriving them per pair.
 
     Parameters
     ----------
-    imA : numpy.ndarray
-        3 or 4D array containing the first image cube.
-    imB : numpy.ndarray
-        3 or 4D array containing the first second cube.
+    *ims : numpy.ndarray
+        3 or 4D arrays containing the co-aligned image cubes. All cubes must
+        share their spatial dimensions.
 
     Returns
     -------
-    aCrop : numpy.ndarray
-        3 or 4D array containing the rotated and cropped data from the first
-        image.
-    bCrop : numpy.ndarray
-        3 or 4D array containing the rotated and cropped data from the second
-        image.
+    crops : numpy.ndarray
+        The rotated and cropped data from each input cube, returned in input
+        order as separate elements of the result tuple.
     cropData : dict
         Dictionary containing the metadata necessary to reconstruct these
         cropped images into their full-frame input using
@@ -418,37 +446,34 @@ def rotate_crop_aligned_data(imA, imB):
         - Can be propagated from unify_boxes if no valid unified corner solution is found.
         - If the arrays are of incompatible dimension.
     """
-    imA = imA.astype("<f4")
-    imB = imB.astype("<f4")
+    if len(ims) < 2:
+        raise ValueError("At least two image cubes are required.")
+    ims = [im.astype("<f4") for im in ims]
+    dims = {im.ndim for im in ims}
     stokes = False
-    if len(imA.shape) == 4 and len(imB.shape) == 4:
+    if dims == {4}:
         stokes = True
-        aMidWvl = imA.shape[1] // 2
-        bMidWvl = imB.shape[1] // 2
-        imACore = np.copy(imA[aMidWvl])
-        imBCore = np.copy(imB[bMidWvl])
-        imA = imA.reshape(-1, *imA.shape[-2:])
-        imB = imB.reshape(-1, *imB.shape[-2:])
-    elif len(imA.shape) == 3 and len(imB.shape) == 3:
-        aMidWvl = imA.shape[0] // 2
-        bMidWvl = imB.shape[0] // 2
-        imACore = np.copy(imA[aMidWvl])
-        imBCore = np.copy(imB[bMidWvl])
+        cores = [np.copy(im[0, im.shape[1] // 2]) for im in ims]
+        ims = [im.reshape(-1, *im.shape[-2:]) for im in ims]
+    elif dims == {3}:
+        cores = [np.copy(im[im.shape[0] // 2]) for im in ims]
     else:
         raise ValueError(
-            "Unexpected dimensionality of imA and imB, expected both 3 or 4, got %d and %d"
-            % (len(imA.shape), len(imB.shape))
+            "Unexpected dimensionality of image cubes, expected all 3 or 4, got %s"
+            % sorted(im.ndim for im in ims)
         )
 
-    if imA.shape[-2:] != imB.shape[-2:]:
+    if len({im.shape[-2:] for im in ims}) != 1:
         raise ValueError("x and y dimensions of image cubes seem incompatible.")
 
-    corners = find_unified_bb(imACore, imBCore)
+    corners = unify_boxes(
+        *[refine_corners(scanline_search_corners(core)) for core in cores]
+    )
     top, left, right, bottom = corners
     br = right - bottom
     brUnit = br / np.linalg.norm(br)
     angle = np.arccos(brUnit @ np.array([1, 0]))
-    imCentre = np.array([imACore.shape[1] // 2, imACore.shape[0] // 2])
+    imCentre = np.array([cores[0].shape[1] // 2, cores[0].shape[0] // 2])
     rotMat = np.array(
         (
             (np.cos(-angle), np.sin(-angle), imCentre[0]),
@@ -467,20 +492,8 @@ def rotate_crop_aligned_data(imA, imB):
     lRot = np.rint(rotMat @ lTrans)
     rRot = np.rint(rotMat @ rTrans)
 
-    imARot = np.empty_like(imA)
-    for wave in range(imA.shape[0]):
-        imARot[wave] = rotate(
-            imA[wave], -np.rad2deg(angle), cval=imA[wave, 0, 0], reshape=False
-        )
-
-    imBRot = np.empty_like(imB)
-    for wave in range(imB.shape[0]):
-        imBRot[wave] = rotate(
-            imB[wave], -np.rad2deg(angle), cval=imB[wave, 0, 0], reshape=False
-        )
-
     cropData = {
-        "frame_dims": (imA.shape[-2], imA.shape[-1]),
+        "frame_dims": (ims[0].shape[-2], ims[0].shape[-1]),
         "x_min": int(bRot[0]),
         "x_max": int(rRot[0]),
         "y_min": int(lRot[1]),
@@ -488,16 +501,22 @@ def rotate_crop_aligned_data(imA, imB):
         "angle": angle,
     }
 
-    aCrop = imARot[
-        :, cropData["y_min"] : cropData["y_max"], cropData["x_min"] : cropData["x_max"]
-    ]
-    bCrop = imBRot[
-        :, cropData["y_min"] : cropData["y_max"], cropData["x_min"] : cropData["x_max"]
-    ]
-    if stokes:
-        aCrop = aCrop.reshape(4, -1, aCrop.shape[-2:])
-        bCrop = bCrop.reshape(4, -1, bCrop.shape[-2:])
-    return aCrop, bCrop, cropData
+    crops = []
+    for im in ims:
+        imRot = np.empty_like(im)
+        for wave in range(im.shape[0]):
+            imRot[wave] = rotate(
+                im[wave], -np.rad2deg(angle), cval=im[wave, 0, 0], reshape=False
+            )
+        crop = imRot[
+            :,
+            cropData["y_min"] : cropData["y_max"],
+            cropData["x_min"] : cropData["x_max"],
+        ]
+        if stokes:
+            crop = crop.reshape(4, -1, *crop.shape[-2:])
+        crops.append(crop)
+    return (*crops, cropData)
 
 
 def rotate_crop_data(im):
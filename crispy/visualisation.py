@@ -837,10 +837,8 @@ class SpectralViewer:
             data = self.cube.file.data[0, ll_idx].astype(np.float)
             data[data < 0] = np.nan
             im1 = self.ax1.imshow(data, cmap="Greys_r")
-        try:
-            el = self.cube.file.header["WDESC1"]
-        except KeyError:
-            el = self.cube.file.header["element"]
+        hdr = self.cube.file.header
+        el = hdr.get("WDESC1") or hdr["element"]
         self.ax1.set_title(rf"{el} {self.aa} {self.D} {self.l}$_{1}$ = {ll} {self.aa}")
         self.fig.colorbar(
             im1, ax=self.ax1, orientation="horizontal", label="Intensity [DNs]"
@@ -886,12 +884,10 @@ class SpectralViewer:
             data = self.cube.list[1].file.data[0, ll2_idx].astype(np.float)
             data[data < 0] = np.nan
             im2 = self.ax2.imshow(data, cmap="Greys_r")
-        try:
-            el1 = self.cube.list[0].file.header["WDESC1"]
-            el2 = self.cube.list[1].file.header["WDESC1"]
-        except KeyError:
-            el1 = self.cube.list[0].file.header["element"]
-            el2 = self.cube.list[1].file.header["element"]
+        hdr1 = self.cube.list[0].file.header
+        hdr2 = self.cube.list[1].file.header
+        el1 = hdr1.get("WDESC1") or hdr1["element"]
+        el2 = hdr2.get("WDESC1") or hdr2["element"]
         self.ax1.set_title(
             rf"{el1} {self.aa} {self.D} {self.l}$_{1}$ = {ll1} {self.aa}"
         )
@@ -2378,10 +2374,8 @@ class ImageViewer:
             data = self.cube.file.data[0, ll_idx].astype(np.float)
             data[data < 0] = np.nan
             im1 = self.ax1.imshow(data, cmap="Greys_r")
-        try:
-            el = self.cube.file.header["WDESC1"]
-        except KeyError:
-            el = self.cube.file.header["element"]
+        hdr = self.cube.file.header
+        el = hdr.get("WDESC1") or hdr["element"]
         self.ax1.set_title(rf"{el} {self.aa} {self.D} {self.l}$_{1}$ = {ll} {self.aa}")
         self.fig.colorbar(
             im1, ax=self.ax1, orientation="horizontal", label="Intensity [DNs]"
@@ -2427,12 +2421,10 @@ class ImageViewer:
             data = self.cube.list[1].file.data[0, ll2_idx].astype(np.float)
             data[data < 0] = np.nan
             im2 = self.ax2.imshow(data, cmap="Greys_r")
-        try:
-            el1 = self.cube.list[0].file.header["WDESC1"]
-            el2 = self.cube.list[1].file.header["WDESC1"]
-        except KeyError:
-            el1 = self.cube.list[0].file.header["element"]
-            el2 = self.cube.list[1].file.header["element"]
+        hdr1 = self.cube.list[0].file.header
+        hdr2 = self.cube.list[1].file.header
+        el1 = hdr1.get("WDESC1") or hdr1["element"]
+        el2 = hdr2.get("WDESC1") or hdr2["element"]
         self.ax1.set_title(
             rf"{el1} {self.aa} {self.D} {self.l}$_{1}$ = {ll1} {self.aa}"
         )
@@ -3551,10 +3543,8 @@ class SpectralTimeViewer:
             data = self.cube1.list[t].file.data[0, ll_idx].astype(np.float)
             data[data < 0] = np.nan
             im1 = self.ax1.imshow(data, cmap="Greys_r")
-        try:
-            el = self.cube1.list[0].file.header["WDESC1"]
-        except KeyError:
-            el = self.cube1.list[0].file.header["element"]
+        hdr = self.cube1.list[0].file.header
+        el = hdr.get("WDESC1") or hdr["element"]
         self.ax1.set_title(rf"{el} {self.aa} {self.D} {self.l}$_{1}$ = {ll} {self.aa}")
         self.fig.colorbar(
             im1, ax=self.ax1, orientation="horizontal", label="Intensity [DNs]"
@@ -3600,12 +3590,10 @@ class SpectralTimeViewer:
             data2 = self.cube2.list[t2].file.data[0, ll2_idx].astype(np.float)
             data2[data2 < 0] = np.nan
             im2 = self.ax2.imshow(data2, cmap="Greys_r")
-        try:
-            el1 = self.cube1.list[0].file.header["WDESC1"]
-            el2 = self.cube2.list[0].file.header["WDESC1"]
-        except KeyError:
-            el1 = self.cube1.list[0].file.header["element"]
-            el2 = self.cube2.list[0].file.header["element"]
+        hdr1 = self.cube1.list[0].file.header
+        hdr2 = self.cube2.list[0].file.header
+        el1 = hdr1.get("WDESC1") or hdr1["element"]
+        el2 = hdr2.get("WDESC1") or hdr2["element"]
         self.ax1.set_title(
             rf"{el1} {self.aa} {self.D} {self.l}$_{1}$ = {ll1} {self.aa}"
         )
@@ -4023,10 +4011,8 @@ class PolarimetricViewer:
             im1 = self.ax1.imshow(
                 self.cube.file.data[s_idx, ll_idx], cmap="Greys_r", vmin=-50, vmax=50
             )
-        try:
-            el = self.cube.file.header["WDESC1"]
-        except KeyError:
-            el = self.cube.file.header["element"]
+        hdr = self.cube.file.header
+        el = hdr.get("WDESC1") or hdr["element"]
         self.ax1.set_title(rf"{el} {self.aa} {self.D} {self.l}$_{1}$ = {ll} {self.aa}")
         self.fig.colorbar(
             im1, ax=self.ax1, orientation="horizontal", label="Intensity [DNs]"
@@ -4635,10 +4621,8 @@ class PolarimetricTimeViewer:
                 vmin=-50,
                 vmax=50,
             )
-        try:
-            el = self.cube.file.header["WDESC1"]
-        except KeyError:
-            el = self.cube.file.header["element"]
+        hdr = self.cube.file.header
+        el = hdr.get("WDESC1") or hdr["element"]
         self.ax1.set_title(rf"{el} {self.aa} {self.D} {self.l}$_{1}$ = {ll} {self.aa}")
         self.fig.colorbar(
             im1, ax=self.ax1, orientation="horizontal", label="Intensity [DNs]"